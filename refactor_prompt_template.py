@@ -1,3 +1,4 @@
+import os
 import requests
 import json
 
@@ -16,7 +17,7 @@ CODE:
 
 headers = {
     "Content-Type": "application/json",
-    "x-api-key": "1cd54a1d237e4693b516a56e8513366a.1r4gXJRbfYp0Nw52",
+    "x-api-key": os.environ["ANTHROPIC_API_KEY"],
     "anthropic-version": "2023-06-01"
 }
 
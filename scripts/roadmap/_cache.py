@@ -0,0 +1,38 @@
+"""
+On-disk cache for parsed roadmap tasks shared by the roadmap scripts.
+
+The parsed result is pickled under <repo>/.cache/<name>.pkl together with the
+caller's format version and the source file's (mtime_ns, size); a matching key
+skips JSON parsing entirely. Callers bump the version whenever the loader's
+output changes, so stale pickles are never returned.
+"""
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+
+def _atomic_write(path: Path, data: bytes):
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, delete=False) as tmp:
+        tmp.write(data)
+    os.replace(tmp.name, path)
+
+
+def load_cached(src: Path, name: str, loader, version: int):
+    st = src.stat()
+    key = (version, st.st_mtime_ns, st.st_size)
+    cache_file = src.parent / ".cache" / f"{name}.pkl"
+    try:
+        cached_key, value = pickle.loads(cache_file.read_bytes())
+        if cached_key == key:
+            return value
+    except Exception:
+        pass  # missing, corrupt or foreign cache file: re-parse
+
+    value = loader(src)
+    try:
+        cache_file.parent.mkdir(exist_ok=True)
+        _atomic_write(cache_file, pickle.dumps((key, value), protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass  # caching is best-effort
+    return value
@@ -0,0 +1,101 @@
+"""
+Helpers shared by the roadmap scripts: locating the repo root and loading
+normalised tasks from blackbox_roadmap_with_backlog.json.
+"""
+import json
+import mmap
+import os
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+from _cache import load_cached
+
+try:
+    import orjson
+except ImportError:  # fall back to ijson / json
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # fall back to loading the whole document with json
+    ijson = None
+
+ROADMAP_FILE = "blackbox_roadmap_with_backlog.json"
+# Part of the on-disk cache key; bump whenever parse_tasks() output changes.
+TASKS_FORMAT_VERSION = 1
+# Below this size the mmap setup costs more than the copy it saves.
+MMAP_MIN_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=32)
+def find_repo_root(start: Path) -> Path:
+    cur = start.resolve()
+    while cur != cur.parent:
+        if (cur / ROADMAP_FILE).exists():
+            return cur
+        cur = cur.parent
+    return start.resolve()
+
+
+@lru_cache(maxsize=64)
+def labels_for(phase: str, status: str):
+    # Only a handful of (phase, status) pairs exist, so each label tuple is built once.
+    return (f"phase:{phase}", f"status:{status}")
+
+
+@lru_cache(maxsize=64)
+def label_csv(phase: str, status: str) -> str:
+    return ",".join(labels_for(phase, status))
+
+
+def orjson_load(f):
+    if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+        return orjson.loads(f.read())
+    # orjson parses straight from the mapped page cache, skipping the read() copy.
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        return orjson.loads(view)
+
+
+def iter_raw_tasks(f):
+    # orjson parses the whole file in one SIMD-accelerated pass; without it, stream
+    # task objects with ijson so the document is never materialised; json is the last resort.
+    if orjson is None and ijson is not None:
+        found = False
+        for t in ijson.items(f, "tasks.item"):
+            found = True
+            yield t
+        if not found:
+            # Legacy files are a bare top-level list of tasks.
+            f.seek(0)
+            yield from ijson.items(f, "item")
+        return
+    data = orjson_load(f) if orjson is not None else json.load(f)
+    yield from (data.get("tasks", data) if isinstance(data, dict) else data)
+
+
+def parse_tasks(src: Path):
+    # One pass building fresh dicts; fields are only read for tasks with a title.
+    with src.open("rb") as f:
+        return [
+            {
+                "title": title,
+                "description": (t.get("description") or t.get("desc") or t.get("desciptio") or "").strip(),
+                "phase": (t.get("phase") or "Unassigned").strip(),
+                "status": (t.get("status") or "To Do").strip(),
+            }
+            for t in iter_raw_tasks(f)
+            if isinstance(t, dict) and (title := (t.get("title") or "").strip())
+        ]
+
+
+@lru_cache(maxsize=8)
+def _load(path: str, mtime_ns: int):
+    tasks = load_cached(Path(path), "roadmap_tasks", parse_tasks, TASKS_FORMAT_VERSION)
+    return tuple(MappingProxyType(t) for t in tasks)
+
+
+def load_tasks(repo_root: Path):
+    src = repo_root / ROADMAP_FILE
+    # Memoised per (path, mtime); callers get fresh dicts they are free to mutate.
+    return [dict(t) for t in _load(str(src), src.stat().st_mtime_ns)]
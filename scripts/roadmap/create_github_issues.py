@@ -1,51 +1,208 @@
 #!/usr/bin/env python3
 """
-Create GitHub issues from blackbox_roadmap_with_backlog.json using GitHub CLI.
+Create GitHub issues from blackbox_roadmap_with_backlog.json via the GitHub REST API.
+
+All issues are created over a single HTTP session, so the TLS handshake is paid once,
+with up to MAX_WORKERS requests in flight. Rate-limit headers are honoured.
+With -j/--graphql, issues are instead created GRAPHQL_BATCH at a time through aliased
+createIssue mutations, one GraphQL request per batch.
 
 Prereqs:
-- Install GitHub CLI: https://cli.github.com/
-- Authenticate: `gh auth login`
+- pip install requests
+- Authenticate: export GITHUB_TOKEN=... (or `gh auth login`; the token is read once via `gh auth token`)
 
 Usage:
   python3 scripts/roadmap/create_github_issues.py --repo owner/name
+  python3 scripts/roadmap/create_github_issues.py --repo owner/name -j
   # or set GH repo via env: export GH_REPO=owner/name
+  # otherwise the repo is resolved once from the checkout via `gh repo view`, as `gh issue create` did
 """
 import argparse
 import json
 import os
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _common import find_repo_root, labels_for, load_tasks
+
+try:
+    import requests
+except ImportError:  # only needed when actually creating issues
+    requests = None
+
+API_URL = "https://api.github.com"
+MAX_WORKERS = 8
+MAX_RETRIES = 5
+GRAPHQL_BATCH = 50
+# GitHub asks for at least a minute between retries of a secondary rate limit without Retry-After.
+SECONDARY_LIMIT_WAIT = 60
+
+# Shared across workers: once any response hits a rate limit, every worker holds off until _resume_at.
+_pause_lock = threading.Lock()
+_resume_at = 0.0
+
+
+def gh_output(*args):
+    # Single `gh` call used for fallbacks; None when gh is missing or fails.
+    if shutil.which("gh") is None:
+        return None
+    try:
+        out = subprocess.check_output(["gh", *args], text=True, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.strip() or None
+
+
+def resolve_token():
+    return os.getenv("GITHUB_TOKEN") or gh_output("auth", "token")
+
+
+def resolve_repo(repo):
+    return repo or gh_output("repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner")
+
+
+def issue_payload(t):
+    title = t["title"].strip()
+    body = (t.get("description") or "Imported from roadmap.").strip()
+    return {"title": title, "body": body, "labels": labels_for(t["phase"], t["status"])}
+
+
+def pause_all(seconds):
+    global _resume_at
+    with _pause_lock:
+        _resume_at = max(_resume_at, time.time() + seconds)
+
+
+def wait_if_paused():
+    while True:
+        with _pause_lock:
+            delay = _resume_at - time.time()
+        if delay <= 0:
+            return
+        time.sleep(delay)
+
+
+def handle_rate_limit(resp, attempt):
+    # Returns True when the request should be retried, after pausing all workers as GitHub directs:
+    # Retry-After first, then the primary quota reset, then the secondary-limit back-off.
+    headers = resp.headers
+    exhausted = headers.get("X-RateLimit-Remaining") == "0"
+    limited = resp.status_code == 429 or (
+        resp.status_code == 403 and (exhausted or "rate limit" in resp.text.lower())
+    )
+    if limited:
+        if attempt == MAX_RETRIES - 1:
+            return False
+        if headers.get("Retry-After"):
+            pause_all(int(headers["Retry-After"]))
+        elif exhausted and "X-RateLimit-Reset" in headers:
+            pause_all(int(headers["X-RateLimit-Reset"]) - time.time())
+        else:
+            pause_all(max(SECONDARY_LIMIT_WAIT, 2 ** attempt))
+        return True
+    if int(headers.get("X-RateLimit-Remaining", "1")) < 10 and "X-RateLimit-Reset" in headers:
+        pause_all(int(headers["X-RateLimit-Reset"]) - time.time())
+    return False
+
+
+def post_json(session, url, payload):
+    for attempt in range(MAX_RETRIES):
+        wait_if_paused()
+        resp = session.post(url, json=payload, timeout=30)
+        if not handle_rate_limit(resp, attempt):
+            break
+    resp.raise_for_status()
+    return resp
+
+
+def create_one(session, url, t) -> bool:
+    payload = issue_payload(t)
+    try:
+        post_json(session, url, payload)
+        return True
+    except requests.RequestException as e:
+        print(f"Failed to create issue for '{payload['title']}': {e}", file=sys.stderr)
+        return False
+
+
+def graphql(session, query, variables):
+    return post_json(session, f"{API_URL}/graphql", {"query": query, "variables": variables}).json()
+
+
+def resolve_graphql_ids(session, repo, label_names):
+    # One query for the repository node ID and the IDs of every label we need.
+    owner, name = repo.split("/", 1)
+    variables = {"owner": owner, "name": name}
+    decls = ["$owner: String!", "$name: String!"]
+    fields = ["id"]
+    for i, label in enumerate(label_names):
+        variables[f"l{i}"] = label
+        decls.append(f"$l{i}: String!")
+        fields.append(f"l{i}: label(name: $l{i}) {{ id }}")
+    query = f"query({', '.join(decls)}) {{ repository(owner: $owner, name: $name) {{ {' '.join(fields)} }} }}"
+    repository = (graphql(session, query, variables).get("data") or {}).get("repository")
+    if not repository:
+        raise ValueError(f"repository {repo} not found")
+
+    label_ids = {}
+    for i, label in enumerate(label_names):
+        node = repository[f"l{i}"]
+        if node is None:
+            # createIssue only accepts existing label IDs; create missing labels through REST.
+            node = {"id": post_json(session, f"{API_URL}/repos/{repo}/labels", {"name": label}).json()["node_id"]}
+        label_ids[label] = node["id"]
+    return repository["id"], label_ids
+
 
-def find_repo_root(start: Path) -> Path:
-    cur = start.resolve()
-    while cur != cur.parent:
-        if (cur / "blackbox_roadmap_with_backlog.json").exists():
-            return cur
-        cur = cur.parent
-    return start.resolve()
+def create_batch(session, repo_id, label_ids, batch) -> int:
+    decls = []
+    fields = []
+    variables = {}
+    for i, t in enumerate(batch):
+        payload = issue_payload(t)
+        variables[f"i{i}"] = {
+            "repositoryId": repo_id,
+            "title": payload["title"],
+            "body": payload["body"],
+            "labelIds": [label_ids[label] for label in payload["labels"]],
+        }
+        decls.append(f"$i{i}: CreateIssueInput!")
+        fields.append(f"i{i}: createIssue(input: $i{i}) {{ issue {{ number }} }}")
+    query = f"mutation({', '.join(decls)}) {{ {' '.join(fields)} }}"
+    try:
+        result = graphql(session, query, variables)
+    except requests.RequestException as e:
+        print(f"Failed to create a batch of {len(batch)} issues: {e}", file=sys.stderr)
+        return 0
+    for err in result.get("errors") or []:
+        print(f"GraphQL error: {err.get('message')}", file=sys.stderr)
+    return sum(1 for v in (result.get("data") or {}).values() if v)
 
 
-def load_tasks(repo_root: Path):
-    src = repo_root / "blackbox_roadmap_with_backlog.json"
-    with src.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    tasks = data.get("tasks", data)
-    for t in tasks:
-        if not isinstance(t, dict):
-            continue
-        # Normalize fields and legacy typos
-        t.setdefault("description", t.get("desc") or t.get("desciptio") or "")
-        t.setdefault("phase", "Unassigned")
-        t.setdefault("status", "To Do")
-    return [t for t in tasks if isinstance(t, dict) and t.get("title")]
+def create_all_graphql(session, repo, tasks) -> int:
+    label_names = sorted({label for t in tasks for label in labels_for(t["phase"], t["status"])})
+    try:
+        repo_id, label_ids = resolve_graphql_ids(session, repo, label_names)
+    except (requests.RequestException, ValueError) as e:
+        print(f"Failed to resolve repository/label IDs for {repo}: {e}", file=sys.stderr)
+        return 0
+    return sum(
+        create_batch(session, repo_id, label_ids, tasks[i:i + GRAPHQL_BATCH])
+        for i in range(0, len(tasks), GRAPHQL_BATCH)
+    )
 
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--repo", default=os.getenv("GH_REPO"), help="owner/name repository slug")
-    parser.add_argument("--dry-run", action="store_true", help="print commands without creating issues")
+    parser.add_argument("--dry-run", action="store_true", help="print issue payloads without creating issues")
+    parser.add_argument("-j", "--graphql", action="store_true",
+                        help=f"create issues in GraphQL batches of {GRAPHQL_BATCH} instead of one REST call each")
     args = parser.parse_args()
 
     repo_root = find_repo_root(Path(__file__).parent)
@@ -54,24 +211,36 @@ def main():
         print("No tasks found.")
         return 1
 
-    base_cmd = ["gh", "issue", "create"]
-    if args.repo:
-        base_cmd += ["--repo", args.repo]
+    session = None
+    if not args.dry_run:
+        args.repo = resolve_repo(args.repo)
+        if not args.repo:
+            print("Missing --repo (or GH_REPO), and `gh repo view` could not infer it.", file=sys.stderr)
+            return 1
+        if requests is None:
+            print("The requests package is required: pip install requests", file=sys.stderr)
+            return 1
+        token = resolve_token()
+        if not token:
+            print("Set GITHUB_TOKEN or authenticate with `gh auth login`.", file=sys.stderr)
+            return 1
+        session = requests.Session()
+        session.headers.update({
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+        })
 
     created = 0
-    for t in tasks:
-        title = t["title"].strip()
-        body = (t.get("description") or "Imported from roadmap.").strip()
-        labels = [f"phase:{t.get('phase','Unassigned')}", f"status:{t.get('status','To Do')}" ]
-        cmd = base_cmd + ["--title", title, "--body", body, "--label", ",".join(labels)]
-        if args.dry_run:
-            print("DRY:", " ".join(cmd))
-            continue
-        try:
-            subprocess.run(cmd, check=True)
-            created += 1
-        except subprocess.CalledProcessError as e:
-            print(f"Failed to create issue for '{title}': {e}", file=sys.stderr)
+    if args.dry_run:
+        for t in tasks:
+            print("DRY:", json.dumps(issue_payload(t), ensure_ascii=False))
+    elif args.graphql:
+        created = create_all_graphql(session, args.repo, tasks)
+    else:
+        url = f"{API_URL}/repos/{args.repo}/issues"
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+            futures = [ex.submit(create_one, session, url, t) for t in tasks]
+            created = sum(f.result() for f in futures)
 
     print(f"Done. Created {created} issues.")
     return 0
@@ -10,37 +10,16 @@ Usage:
   python3 scripts/roadmap/generate.py
 """
 import csv
-import json
+import io
 import os
+from operator import itemgetter
 from pathlib import Path
+from typing import Dict
 
+from _common import find_repo_root, label_csv, load_tasks
 
-def find_repo_root(start: Path) -> Path:
-    cur = start.resolve()
-    while cur != cur.parent:
-        if (cur / "blackbox_roadmap_with_backlog.json").exists():
-            return cur
-        cur = cur.parent
-    return start.resolve()
-
-
-def load_tasks(repo_root: Path):
-    src = repo_root / "blackbox_roadmap_with_backlog.json"
-    with src.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    tasks = data.get("tasks", data)
-    norm = []
-    for t in tasks:
-        if not isinstance(t, dict):
-            continue
-        title = (t.get("title") or "").strip()
-        desc = (t.get("description") or t.get("desc") or t.get("desciptio") or "").strip()
-        phase = (t.get("phase") or "Unassigned").strip()
-        status = (t.get("status") or "To Do").strip()
-        if not title:
-            continue
-        norm.append({"title": title, "description": desc, "phase": phase, "status": status})
-    return norm
+PHASES = ("Now", "Next", "Later", "Unassigned")
+PANDAS_MIN_ROWS = 500
 
 
 def ensure_dirs(repo_root: Path):
@@ -48,12 +27,37 @@ def ensure_dirs(repo_root: Path):
     (repo_root / "tools" / "github").mkdir(parents=True, exist_ok=True)
 
 
-def write_markdown(repo_root: Path, tasks):
-    by_phase = {"Now": [], "Next": [], "Later": [], "Unassigned": []}
+def csv_bytes(header, rows) -> bytes:
+    if len(rows) > PANDAS_MIN_ROWS:
+        # pandas' vectorised writer wins on large backlogs; importing it costs ~150ms.
+        try:
+            import pandas as pd
+        except ImportError:
+            pd = None
+        if pd is not None:
+            frame = pd.DataFrame(rows, columns=header)
+            return frame.to_csv(index=False, lineterminator="\r\n").encode("utf-8")
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    w.writerow(header)
+    w.writerows(rows)
+    return buf.getvalue().encode("utf-8")
+
+
+def build_all(tasks) -> Dict[str, bytes]:
+    """Render every artifact in memory, keyed by path relative to the repo root."""
+    by_phase = {p: [] for p in PHASES}
+    unassigned = by_phase["Unassigned"]
+    roadmap_rows = []
+    import_rows = []
     for t in tasks:
-        by_phase.setdefault(t["phase"], []).append(t)
+        t["_k"] = (t["status"], t["title"].lower())
+        # Unknown phases are never rendered; file them under Unassigned.
+        by_phase.get(t["phase"], unassigned).append(t)
+        roadmap_rows.append([t["title"], t["description"], t["phase"], t["status"]])
+        import_rows.append([t["title"], t["description"] or "Imported from roadmap.", label_csv(t["phase"], t["status"])])
     for v in by_phase.values():
-        v.sort(key=lambda x: (x["status"], x["title"].lower()))
+        v.sort(key=itemgetter("_k"))
 
     md = [
         "# Roadmap",
@@ -61,21 +65,6 @@ def write_markdown(repo_root: Path, tasks):
         "Source: `blackbox_roadmap_with_backlog.json`. Phases reflect delivery priority. Update with `python3 scripts/roadmap/generate.py`.",
         "",
     ]
-    for phase in ("Now", "Next", "Later"):
-        if not by_phase.get(phase):
-            continue
-        md.append(f"## {phase}")
-        for t in by_phase[phase]:
-            line = f"- {t['title']} — {t['status']}"
-            if t["description"]:
-                short = t["description"].replace("\n", " ").strip()
-                if len(short) > 160:
-                    short = short[:157] + "..."
-                line += f"\n  - {short}"
-            md.append(line)
-        md.append("")
-    (repo_root / "docs" / "ROADMAP.md").write_text("\n".join(md) + "\n", encoding="utf-8")
-
     # Kanban view
     kanban = [
         "# Roadmap Kanban",
@@ -84,37 +73,36 @@ def write_markdown(repo_root: Path, tasks):
         "",
     ]
     for phase in ("Now", "Next", "Later"):
-        if not by_phase.get(phase):
+        if not by_phase[phase]:
             continue
+        md.append(f"## {phase}")
         kanban.append(f"## {phase}")
         for t in by_phase[phase]:
+            md.append(f"- {t['title']} — {t['status']}")
+            if t["description"]:
+                short = t["description"].replace("\n", " ").strip()
+                if len(short) > 160:
+                    short = short[:157] + "..."
+                md.append(f"  - {short}")
             kanban.append(f"- [{t['status']}] {t['title']}")
+        md.append("")
         kanban.append("")
-    (repo_root / "docs" / "ROADMAP_KANBAN.md").write_text("\n".join(kanban) + "\n", encoding="utf-8")
-
-
-def write_csv(repo_root: Path, tasks):
-    with (repo_root / "docs" / "roadmap.csv").open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(["title", "description", "phase", "status"])
-        for t in tasks:
-            w.writerow([t["title"], t["description"], t["phase"], t["status"]])
 
-    with (repo_root / "tools" / "github" / "issues_import.csv").open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(["Title", "Body", "Labels"])  # GitHub CSV import headers
-        for t in tasks:
-            labels = [f"phase:{t['phase']}", f"status:{t['status']}"]
-            body = t["description"] or "Imported from roadmap."
-            w.writerow([t["title"], body, ",".join(labels)])
+    return {
+        "docs/ROADMAP.md": ("\n".join(md) + "\n").encode("utf-8"),
+        "docs/ROADMAP_KANBAN.md": ("\n".join(kanban) + "\n").encode("utf-8"),
+        "docs/roadmap.csv": csv_bytes(["title", "description", "phase", "status"], roadmap_rows),
+        # GitHub CSV import headers
+        "tools/github/issues_import.csv": csv_bytes(["Title", "Body", "Labels"], import_rows),
+    }
 
 
 def main():
     repo_root = find_repo_root(Path(__file__).parent)
     ensure_dirs(repo_root)
     tasks = load_tasks(repo_root)
-    write_markdown(repo_root, tasks)
-    write_csv(repo_root, tasks)
+    for rel_path, data in build_all(tasks).items():
+        (repo_root / rel_path).write_bytes(data)
     print(f"Generated roadmap assets for {len(tasks)} tasks under docs/ and tools/github/.")
 
 